@@ -5,9 +5,10 @@ This module provides slash commands for managing scheduled channel creation,
 deletion, and configuration display.
 """
 
+import asyncio
+import functools
 import logging
 import re
-from datetime import datetime
 from typing import Optional
 
 import discord
@@ -16,10 +17,15 @@ from discord import Color, Embed, Interaction, app_commands
 from client import client
 from configuration import TIMEZONE
 from database import database
-from resources.permissions import has_permissions
 
 logger = logging.getLogger(__name__)
 
+# Embed colours, built once and shared by every response
+_COLOR_RED, _COLOR_GREEN, _COLOR_BLUE = Color.red(), Color.green(), Color.blue()
+
+# Duration strings such as "2h 30m", "90m" or "1h"
+_DURATION_RE = re.compile(r"\A(?:(\d+)h)?\s*(?:(\d+)m)?\Z")
+
 
 def convert_to_minutes(time_str: str) -> Optional[int]:
     """
@@ -39,23 +45,28 @@ def convert_to_minutes(time_str: str) -> Optional[int]:
     if not time_str:
         return 0
 
-    pattern = r"(?:(\d+)h)?\s*(?:(\d+)m)?"
-    match = re.match(pattern, time_str.lower().strip())
+    match = _DURATION_RE.match(time_str.strip().lower())
+
+    if not match:
+        return None
 
-    if not match or not any(match.groups()):
+    hours, minutes = match.groups()
+    if hours is None and minutes is None:
         return None
 
-    hours = int(match.group(1)) if match.group(1) else 0
-    minutes = int(match.group(2)) if match.group(2) else 0
-    return hours * 60 + minutes
+    return int(hours or 0) * 60 + int(minutes or 0)
 
 
 def validate_time_format(time_str: str) -> Optional[str]:
     """
     Validate and convert AM/PM time to 24-hour format.
 
+    Parsed with plain string operations and formatted directly from the
+    resulting integers; no regex or datetime object is involved.
+
     Args:
-        time_str: Time string in 12-hour format (e.g., "2:30 PM")
+        time_str: Time string in 12-hour (e.g., "2:30 PM") or 24-hour
+            (e.g., "14:30") format
 
     Returns:
         Time in 24-hour format (HH:MM) or None if invalid
@@ -63,23 +74,43 @@ def validate_time_format(time_str: str) -> Optional[str]:
     if not time_str:
         return None
 
-    try:
-        parsed_time = datetime.strptime(time_str.strip(), "%I:%M %p")
-        return parsed_time.strftime("%H:%M")
-    except ValueError:
-        try:
-            # Try without AM/PM for 24-hour format
-            parsed_time = datetime.strptime(time_str.strip(), "%H:%M")
-            return parsed_time.strftime("%H:%M")
-        except ValueError:
+    s = time_str.strip().lower()
+    meridiem = None
+    if s.endswith(("am", "pm")):
+        meridiem = s[-2:]
+        s = s[:-2].rstrip()
+
+    hours_str, _, minutes_str = s.partition(":")
+    if not (
+        0 < len(hours_str) <= 2
+        and len(minutes_str) == 2
+        and hours_str.isdecimal()
+        and minutes_str.isdecimal()
+    ):
+        return None
+
+    hours = int(hours_str)
+    minutes = int(minutes_str)
+
+    if minutes > 59:
+        return None
+
+    if meridiem:
+        # 12-hour clock: 12 AM is midnight, 12 PM is noon
+        if not 1 <= hours <= 12:
             return None
+        hours = hours % 12 + (12 if meridiem == "pm" else 0)
+    elif hours > 23:
+        return None
+
+    return f"{hours:02d}:{minutes:02d}"
 
 
 @client.tree.command(
     name="scheduled_channel_create",
     description="Create, show, or remove scheduled channel configurations",
 )
-@has_permissions(manage_guild=True)
+@app_commands.checks.has_permissions(manage_guild=True)
 @app_commands.choices(
     action=[
         app_commands.Choice(name="Set", value=1),
@@ -117,8 +148,6 @@ async def scheduled_channel_create(
     guild_id = interaction.guild.id
 
     try:
-        database.connect()
-
         if action == 1:  # Set configuration
             await handle_set_action(
                 interaction,
@@ -137,12 +166,12 @@ async def scheduled_channel_create(
             await handle_show_action(interaction, guild_id)
 
     except Exception as e:
-        logger.error(f"Error in scheduled_channel_create command: {e}", exc_info=True)
+        logger.error("Error in scheduled_channel_create command: %s", e, exc_info=True)
 
         error_embed = Embed(
             title="❌ Error",
             description="An error occurred while processing your request. Please try again.",
-            color=Color.red(),
+            color=_COLOR_RED,
         )
 
         try:
@@ -154,8 +183,6 @@ async def scheduled_channel_create(
                 await interaction.followup.send(embed=error_embed, ephemeral=True)
         except:
             pass
-    finally:
-        database.close()
 
 
 async def handle_set_action(
@@ -171,7 +198,7 @@ async def handle_set_action(
 ) -> None:
     """Handle the 'Set' action for creating a new configuration."""
     # Validate required parameters
-    if not all([category, daily_time, channel_name, channel_text]):
+    if category is None or not daily_time or not channel_name or not channel_text:
         await interaction.response.send_message(
             "❌ **Missing Required Fields**\n"
             "For 'Set' action, you must provide: `category`, `daily_time`, `channel_name`, and `channel_text`.",
@@ -209,8 +236,13 @@ async def handle_set_action(
         )
         return
 
+    # Acknowledge the interaction before touching the database so a slow
+    # write cannot run past Discord's response deadline
+    await interaction.response.defer()
+
     # Add configuration to database
-    database.add_channel_creation(
+    await asyncio.to_thread(
+        database.add_channel_creation,
         guild_id,
         category.id,
         daily_time_24hr,
@@ -225,7 +257,7 @@ async def handle_set_action(
     embed = Embed(
         title="✅ Scheduled Channel Creation Set",
         description=f"Successfully configured scheduled channel creation for **{channel_name}**",
-        color=Color.green(),
+        color=_COLOR_GREEN,
     )
 
     embed.add_field(
@@ -234,7 +266,7 @@ async def handle_set_action(
             f"**Category:** {category.mention}\n"
             f"**Daily Time:** {daily_time} ({daily_time_24hr} {TIMEZONE})\n"
             f"**Channel Name:** {channel_name}\n"
-            f"**Initial Message:** {channel_text[:100]}{'...' if len(channel_text) > 100 else ''}\n"
+            f"**Initial Message:** {_truncate(channel_text)}\n"
             f"**Role Access:** {channel_role.mention if channel_role else 'None'}\n"
             f"**Delete After:** {format_duration(close_after_minutes)}\n"
             f"**Lock After:** {format_duration(lock_after_minutes)}"
@@ -243,7 +275,7 @@ async def handle_set_action(
     )
 
     embed.set_footer(text=f"Timezone: {TIMEZONE}")
-    await interaction.response.send_message(embed=embed)
+    await interaction.followup.send(embed=embed)
 
 
 async def handle_remove_action(
@@ -260,7 +292,7 @@ async def handle_remove_action(
         return
 
     # Check if configuration exists
-    config = database.get_channel_creation(guild_id, config_id)
+    config = await asyncio.to_thread(database.get_channel_creation, guild_id, config_id)
     if not config:
         await interaction.response.send_message(
             f"❌ **Configuration Not Found**\n"
@@ -270,23 +302,25 @@ async def handle_remove_action(
         return
 
     # Remove configuration
-    success = database.delete_channel_creation(config_id, guild_id)
+    success = await asyncio.to_thread(
+        database.delete_channel_creation, config_id, guild_id
+    )
     if success:
         embed = Embed(
             title="✅ Configuration Removed",
             description=f"Successfully removed scheduled channel configuration with ID `{config_id}`",
-            color=Color.green(),
+            color=_COLOR_GREEN,
         )
         embed.add_field(
             name="Removed Configuration",
-            value=f"**Channel Name:** {config[5]}\n**Daily Time:** {config[3]}",
+            value=f"**Channel Name:** {config.channel_name}\n**Daily Time:** {_format_time_of_day(config.daily_creation_time)}",
             inline=False,
         )
     else:
         embed = Embed(
             title="❌ Removal Failed",
             description="Failed to remove the configuration. Please try again.",
-            color=Color.red(),
+            color=_COLOR_RED,
         )
 
     await interaction.response.send_message(embed=embed)
@@ -294,80 +328,63 @@ async def handle_remove_action(
 
 async def handle_show_action(interaction: Interaction, guild_id: int) -> None:
     """Handle the 'Show' action for displaying all configurations."""
-    configs = database.get_all_channel_creations(guild_id)
+    await interaction.response.defer()
+    configs = await asyncio.to_thread(database.get_all_channel_creations, guild_id)
 
     if not configs:
         embed = Embed(
             title="📋 Scheduled Channel Configurations",
             description="No scheduled channel configurations found for this server.",
-            color=Color.blue(),
+            color=_COLOR_BLUE,
         )
         embed.add_field(
             name="Getting Started",
             value="Use the 'Set' action to create your first scheduled channel configuration!",
             inline=False,
         )
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
         return
 
-    embed = Embed(
-        title="📋 Scheduled Channel Configurations",
-        description=f"Found {len(configs)} configuration(s) for this server:",
-        color=Color.blue(),
-    )
-
-    for i, config in enumerate(configs[:10]):  # Limit to 10 to avoid embed limits
-        try:
-            (
-                config_id,
-                guild_id,
-                category_id,
-                daily_creation_time,
-                close_after_minutes,
-                channel_name,
-                channel_text,
-                channel_role,
-                lock_after_minutes,
-                created_at,
-            ) = config
-        except ValueError:
-            # Handle older database format without created_at
-            (
-                config_id,
-                guild_id,
-                category_id,
-                daily_creation_time,
-                close_after_minutes,
-                channel_name,
-                channel_text,
-                channel_role,
-                lock_after_minutes,
-            ) = config
-
-        category_mention = f"<#{category_id}>"
-        role_mention = f"<@&{channel_role}>" if channel_role else "None"
+    fields = []
+    for config in configs[:10]:  # Limit to 10 to avoid embed limits
+        category_mention = f"<#{config.category_id}>"
+        role_mention = f"<@&{config.channel_role}>" if config.channel_role else "None"
 
         field_value = (
-            f"**ID:** {config_id}\n"
+            f"**ID:** {config.id}\n"
             f"**Category:** {category_mention}\n"
-            f"**Daily Time:** {daily_creation_time} {TIMEZONE}\n"
+            f"**Daily Time:** {_format_time_of_day(config.daily_creation_time)} {TIMEZONE}\n"
             f"**Role Access:** {role_mention}\n"
-            f"**Delete After:** {format_duration(close_after_minutes)}\n"
-            f"**Lock After:** {format_duration(lock_after_minutes)}"
+            f"**Delete After:** {format_duration(config.close_after)}\n"
+            f"**Lock After:** {format_duration(config.lock_after)}"
         )
 
-        embed.add_field(name=f"🔹 {channel_name}", value=field_value, inline=True)
+        fields.append(
+            {"name": f"🔹 {config.channel_name}", "value": field_value, "inline": True}
+        )
 
     if len(configs) > 10:
-        embed.set_footer(
-            text=f"Showing 10 of {len(configs)} configurations. Use pagination for more."
+        footer_text = (
+            f"Showing 10 of {len(configs)} configurations. Use pagination for more."
         )
     else:
-        embed.set_footer(text=f"Timezone: {TIMEZONE}")
+        footer_text = f"Timezone: {TIMEZONE}"
+
+    # Build the embed in one go rather than through repeated add_field calls
+    embed = Embed.from_dict(
+        {
+            "title": "📋 Scheduled Channel Configurations",
+            "description": f"Found {len(configs)} configuration(s) for this server:",
+            "color": _COLOR_BLUE.value,
+            "fields": fields,
+            "footer": {"text": footer_text},
+        }
+    )
 
-    await interaction.response.send_message(embed=embed)
+    await interaction.followup.send(embed=embed)
 
 
+@functools.lru_cache(maxsize=256)
 def format_duration(minutes: int) -> str:
     """
     Format duration in minutes to a human-readable string.
@@ -382,9 +399,35 @@ def format_duration(minutes: int) -> str:
         return "Never"
 
     hours, mins = divmod(minutes, 60)
-    if hours > 0 and mins > 0:
-        return f"{hours}h {mins}m"
-    elif hours > 0:
-        return f"{hours}h"
-    else:
-        return f"{mins}m"
+    if hours:
+        return f"{hours}h {mins}m" if mins else f"{hours}h"
+    return f"{mins}m"
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """
+    Shorten text for embed previews.
+
+    Args:
+        text: Text to shorten
+        limit: Maximum number of characters kept before the ellipsis
+
+    Returns:
+        The text unchanged if it fits, otherwise its first characters
+        followed by an ellipsis
+    """
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _format_time_of_day(minutes: int) -> str:
+    """
+    Format minutes past midnight as a 24-hour HH:MM string.
+
+    Args:
+        minutes: Minutes past midnight, as stored in the database
+
+    Returns:
+        Time in 24-hour format (HH:MM)
+    """
+    hours, mins = divmod(minutes, 60)
+    return f"{hours:02d}:{mins:02d}"
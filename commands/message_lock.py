@@ -1,17 +1,20 @@
+import logging
 from typing import Optional as op
 
 import discord
 from discord import Color, Embed, File, Interaction, app_commands, utils
 
 from client import client
-from resources.permissions import has_permissions
+from resources.messaging import send_dms
+
+logger = logging.getLogger(__name__)
 
 
 @client.tree.command(
     name="lock_channel_for_others",
     description="Allows a specific role to view the current channel and optionally send DMs to the role members",
 )
-@has_permissions(manage_channels=True)
+@app_commands.checks.has_permissions(manage_channels=True)
 async def lock_channel_for_others(
     interaction: Interaction,
     role: op[discord.Role],
@@ -23,37 +26,47 @@ async def lock_channel_for_others(
     guild = interaction.guild
 
     try:
-        if role:
-            await channel.set_permissions(role, read_messages=True, send_messages=True)
-            if dm_message:
-                members_with_role = [
-                    member for member in guild.members if role in member.roles
-                ]
+        # Build every overwrite change up front and apply them in one request
+        # (channel.overwrites rebuilds its dict on every access, so read it once)
+        new_overwrites = channel.overwrites
+        ow_items = list(new_overwrites.items())
 
-                embed_dm = Embed(
-                    title="Channel Access", description=dm_message, color=Color.blue()
-                )
-                if channel:
-                    embed_dm.add_field(name="Channel:", value=channel.mention)
-                for member in members_with_role:
-                    try:
-                        await member.send(embed=embed_dm)
-                    except Exception as e:
-                        print(f"Failed to send DM to {member}: {e}")
-                        continue
-        else:
-            role = None
-        overwrites = channel.overwrites
-
-        for target, overwrite in overwrites.items():
+        for target, overwrite in ow_items:
             if isinstance(target, discord.Role) and target != role:
 
-                if overwrite.read_messages is not None and overwrite.read_messages:
+                if overwrite.read_messages:
                     # Lock out the role (remove view permission)
-                    await channel.set_permissions(target, read_messages=False)
+                    new_overwrites[target] = discord.PermissionOverwrite(
+                        read_messages=False
+                    )
 
         # Lock out the default role as well
-        await channel.set_permissions(guild.default_role, read_messages=False)
+        new_overwrites[guild.default_role] = discord.PermissionOverwrite(
+            read_messages=False
+        )
+
+        if role:
+            new_overwrites[role] = discord.PermissionOverwrite(
+                read_messages=True, send_messages=True
+            )
+
+        await channel.edit(overwrites=new_overwrites)
+
+        if role and dm_message:
+            members_with_role = role.members
+
+            embed_dm = Embed(
+                title="Channel Access", description=dm_message, color=Color.blue()
+            )
+            if channel:
+                embed_dm.add_field(name="Channel:", value=channel.mention)
+            success_count = await send_dms(members_with_role, embed_dm)
+            logger.info(
+                "Sent DMs to %s/%s members of %s",
+                success_count,
+                len(members_with_role),
+                role.name,
+            )
 
         if role:
             embed = Embed(
@@ -77,4 +90,4 @@ async def lock_channel_for_others(
 
     except Exception as e:
         await interaction.followup.send(f"An error occurred: {e}")
-        print(e)
+        logger.error("Error in lock_channel_for_others command: %s", e, exc_info=True)
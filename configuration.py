@@ -6,24 +6,30 @@ settings from the .env file and environment.
 """
 
 import os
-import sys
+from datetime import tzinfo
 from typing import Optional
 
+import pytz
 from dotenv import load_dotenv
 
-# Load environment variables from configuration.env
-load_dotenv(dotenv_path="configuration.env")
+# Load environment variables from configuration.env, unless they have
+# already been injected (e.g. by Docker or the CI environment)
+if "BOT_TOKEN" not in os.environ:
+    load_dotenv(dotenv_path="configuration.env")
 
 # Bot configuration
 BOT_TOKEN: Optional[str] = os.getenv("BOT_TOKEN")
 TIMEZONE: str = os.getenv("TIMEZONE", "UTC")  # Default to UTC if not specified
+# Resolved once; pytz.timezone() walks its tzdata cache on every call
+TZINFO: tzinfo = pytz.timezone(TIMEZONE)
 
 # Validate required configuration
 if not BOT_TOKEN:
-    print("❌ Error: BOT_TOKEN not found in environment variables!")
-    print("Please create a configuration.env file with your bot token.")
-    print("See configuration.env.template for an example.")
-    sys.exit(1)
+    raise RuntimeError(
+        "BOT_TOKEN not found in environment variables. Please create a "
+        "configuration.env file with your bot token "
+        "(see configuration.env.template for an example)."
+    )
 
 # Database configuration
 DATABASE_FILE: str = os.getenv("DATABASE_FILE", "system_data.db")
@@ -34,8 +40,3 @@ LOG_FILE: str = os.getenv("LOG_FILE", "bot.log")
 
 # Task configuration
 TASK_INTERVAL_MINUTES: int = int(os.getenv("TASK_INTERVAL_MINUTES", "1"))
-
-print(f"✅ Configuration loaded successfully")
-print(f"📍 Timezone: {TIMEZONE}")
-print(f"📊 Database: {DATABASE_FILE}")
-print(f"⏱️  Task interval: {TASK_INTERVAL_MINUTES} minute(s)")
@@ -6,16 +6,152 @@ channel creation configurations, and channel lock management.
 """
 
 import logging
+import queue
 import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, List, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
-import pytz
 
-from configuration import DATABASE_FILE, TIMEZONE
+from configuration import DATABASE_FILE, TZINFO
 
 logger = logging.getLogger(__name__)
 
+# Bind datetimes as integer Unix timestamps; channel_lock stores them as such
+sqlite3.register_adapter(datetime, lambda dt: int(dt.timestamp()))
+
+# Maximum number of idle read-only connections kept around for reuse
+READER_POOL_SIZE = 4
+
+# Rows pulled per fetchmany() call when streaming large result sets
+FETCH_CHUNK_SIZE = 1000
+
+
+class ChannelCreation(NamedTuple):
+    """A row of the channel_creation table."""
+
+    id: int
+    guild_id: int
+    category_id: int
+    daily_creation_time: int
+    close_after: Optional[int]
+    channel_name: str
+    channel_start_text: Optional[str]
+    channel_role: Optional[int]
+    lock_after: Optional[int]
+    created_at: Optional[str]
+
+
+class ChannelLock(NamedTuple):
+    """A row of the channel_lock table."""
+
+    id: int
+    guild_id: int
+    channel_id: int
+    creation_time: int
+    lock_in: int
+    channel_role: Optional[int]
+    created_at: Optional[str]
+
+
+_SQL_CREATE_CREATION_TABLE = """
+CREATE TABLE IF NOT EXISTS channel_creation (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    category_id INTEGER NOT NULL,
+    daily_creation_time INTEGER NOT NULL,  -- minutes past midnight
+    close_after INTEGER,
+    channel_name TEXT NOT NULL,
+    channel_start_text TEXT,
+    channel_role INTEGER,
+    lock_after INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+_SQL_CREATE_LOCK_TABLE = """
+CREATE TABLE IF NOT EXISTS channel_lock (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    creation_time INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    lock_in INTEGER NOT NULL,
+    channel_role INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (guild_id, channel_id)
+)
+"""
+
+# Converts a legacy "HH:MM" daily_creation_time into minutes past midnight
+_SQL_HHMM_TO_MINUTES = (
+    "CAST(substr(daily_creation_time, 1, instr(daily_creation_time, ':') - 1) "
+    "AS INTEGER) * 60 + "
+    "CAST(substr(daily_creation_time, instr(daily_creation_time, ':') + 1) "
+    "AS INTEGER)"
+)
+
+# Statements are kept as module-level constants so every call passes the
+# identical string and hits the connection's prepared statement cache
+_SQL_INSERT_CREATION = (
+    "INSERT INTO channel_creation "
+    "(guild_id, category_id, daily_creation_time, close_after, "
+    "channel_name, channel_start_text, channel_role, lock_after) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# Columns are listed explicitly so rows line up with the NamedTuple fields
+_SQL_SELECT_CREATION = (
+    "SELECT id, guild_id, category_id, daily_creation_time, close_after, "
+    "channel_name, channel_start_text, channel_role, lock_after, created_at "
+    "FROM channel_creation "
+)
+_SQL_SELECT_LOCK = (
+    "SELECT id, guild_id, channel_id, creation_time, lock_in, channel_role, "
+    "created_at FROM channel_lock"
+)
+_SQL_GET_CREATION = _SQL_SELECT_CREATION + "WHERE guild_id = ? AND id = ?"
+_SQL_GET_CREATIONS = _SQL_SELECT_CREATION + "WHERE guild_id = ? ORDER BY id"
+_SQL_DELETE_CREATION = "DELETE FROM channel_creation WHERE id = ? AND guild_id = ?"
+_SQL_GET_LOCKS = _SQL_SELECT_LOCK + " WHERE guild_id = ?"
+_SQL_GET_ALL_LOCKS = _SQL_SELECT_LOCK
+# Everything a scheduler tick acts on, in one statement: creation configs due
+# in the tick's window and locks whose deadline has passed. Lock rows carry
+# their channel id in the id column and NULL in the creation-only columns.
+# The deadline expression must match idx_cl_lock_at exactly for it to be used.
+_SQL_DUE_LOCK_OPS = (
+    "SELECT 'lock', channel_id, guild_id, NULL, NULL, NULL, NULL, NULL, "
+    "channel_role, NULL, NULL FROM channel_lock "
+    "WHERE creation_time + lock_in * 60 <= ?"
+)
+_SQL_DUE_CREATION_OPS = "SELECT 'create', " + _SQL_SELECT_CREATION[len("SELECT ") :]
+_SQL_GET_DUE_OPS = (
+    _SQL_DUE_CREATION_OPS
+    + "WHERE daily_creation_time BETWEEN ? AND ? UNION ALL "
+    + _SQL_DUE_LOCK_OPS
+)
+# Window that wraps past midnight, e.g. 23:58 to 00:02
+_SQL_GET_DUE_OPS_WRAPPED = (
+    _SQL_DUE_CREATION_OPS
+    + "WHERE (daily_creation_time >= ? OR daily_creation_time <= ?) UNION ALL "
+    + _SQL_DUE_LOCK_OPS
+)
+_SQL_UPDATE_LOCK = (
+    "UPDATE channel_lock SET lock_in = ? WHERE guild_id = ? AND channel_id = ?"
+)
+# Updates an existing lock in place (keeping its id and created_at) rather
+# than deleting and re-inserting it like INSERT OR REPLACE would
+_SQL_UPSERT_LOCK = (
+    "INSERT INTO channel_lock "
+    "(guild_id, channel_id, lock_in, channel_role, creation_time) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (guild_id, channel_id) DO UPDATE SET "
+    "lock_in = excluded.lock_in, "
+    "channel_role = excluded.channel_role, "
+    "creation_time = excluded.creation_time"
+)
+_SQL_DELETE_LOCK = "DELETE FROM channel_lock WHERE guild_id = ? AND channel_id = ?"
+
 
 class Database:
     """
@@ -23,6 +159,10 @@ class Database:
 
     Manages SQLite database operations for channel creation configurations
     and channel lock scheduling.
+
+    A single writer connection is kept open for the lifetime of the process
+    and serialised with a lock, while reads go through a small pool of
+    read-only connections that can run concurrently under WAL.
     """
 
     def __init__(self, db_name: str = DATABASE_FILE) -> None:
@@ -35,59 +175,233 @@ class Database:
         self.db_name = db_name
         self.conn: Optional[sqlite3.Connection] = None
         self.c: Optional[sqlite3.Cursor] = None
+        self._write_lock = threading.Lock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue(
+            maxsize=READER_POOL_SIZE
+        )
+        self.connect()
 
     def connect(self) -> None:
-        """Establish connection to the SQLite database."""
+        """
+        Establish the writer connection to the SQLite database.
+
+        The connection is reused for the lifetime of the process; calling
+        this while a connection is already open is a no-op.
+        """
+        if self.conn is not None:
+            return
+
         try:
-            self.conn = sqlite3.connect(self.db_name)
+            self.conn = sqlite3.connect(
+                self.db_name, check_same_thread=False, cached_statements=256
+            )
+            self._apply_pragmas()
             self.c = self.conn.cursor()
-            logger.debug(f"Connected to database: {self.db_name}")
+            logger.debug("Connected to database: %s", self.db_name)
         except sqlite3.Error as e:
-            logger.error(f"Failed to connect to database: {e}")
+            logger.error("Failed to connect to database: %s", e)
             raise e
 
-    def create_table(self) -> None:
-        """Create necessary database tables if they don't exist."""
+    def _apply_pragmas(self) -> None:
+        """Tune the freshly opened connection for a long-running bot."""
+        # WAL lets the scheduled task read while commands write, and only
+        # needs an fsync at checkpoint time with synchronous=NORMAL
+        if self.db_name != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            # Checkpoint every ~1000 pages and trim the -wal file afterwards
+            self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+            self.conn.execute("PRAGMA journal_size_limit=67108864")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-20000")
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a new read-only connection to the database file."""
+        reader = sqlite3.connect(
+            f"file:{self.db_name}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        reader.execute("PRAGMA busy_timeout=30000")
+        reader.execute("PRAGMA temp_store=MEMORY")
+        reader.execute("PRAGMA mmap_size=268435456")
+        reader.execute("PRAGMA cache_size=-20000")
+        logger.debug("Opened read-only connection to %s", self.db_name)
+        return reader
+
+    def fill_reader_pool(self) -> None:
+        """
+        Open the pooled read-only connections up front.
+
+        Called once at startup, after the tables exist, so the first
+        scheduler tick does not pay for opening connections.
+        """
+        if self.db_name == ":memory:":
+            return
         try:
-            # Channel creation configurations table
-            self.c.execute(
-                """
-            CREATE TABLE IF NOT EXISTS channel_creation (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                category_id INTEGER NOT NULL,
-                daily_creation_time TEXT NOT NULL,
-                close_after INTEGER,
-                channel_name TEXT NOT NULL,
-                channel_start_text TEXT,
-                channel_role INTEGER,
-                lock_after INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
+            while not self._readers.full():
+                self._readers.put_nowait(self._open_reader())
+        except sqlite3.Error as e:
+            logger.error("Failed to open read-only connections: %s", e)
+
+    @contextmanager
+    def _borrow_reader(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Borrow a cursor on a pooled read-only connection.
+
+        In-memory databases are private to their connection, so those
+        fall back to the writer connection.
+        """
+        if self.db_name == ":memory:":
+            with self._write_lock:
+                yield self.conn.cursor()
+            return
+
+        try:
+            reader = self._readers.get_nowait()
+        except queue.Empty:
+            reader = self._open_reader()
+
+        try:
+            yield reader.cursor()
+        finally:
+            try:
+                self._readers.put_nowait(reader)
+            except queue.Full:
+                reader.close()
+
+    def optimize(self) -> None:
+        """Let SQLite refresh its query planner statistics if needed."""
+        try:
+            with self._write_lock:
+                self.conn.execute("PRAGMA optimize")
+            logger.debug("Ran PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.error("Failed to optimize database: %s", e)
+
+    def checkpoint(self) -> None:
+        """Merge the write-ahead log into the database and truncate it."""
+        if self.db_name == ":memory:":
+            return
+        try:
+            with self._write_lock:
+                busy, log_pages, checkpointed = self.conn.execute(
+                    "PRAGMA wal_checkpoint(TRUNCATE)"
+                ).fetchone()
+            logger.debug(
+                "WAL checkpoint: busy=%s, log=%s, checkpointed=%s",
+                busy,
+                log_pages,
+                checkpointed,
             )
+        except sqlite3.Error as e:
+            logger.error("Failed to checkpoint database: %s", e)
+
+    def _column_type(self, table: str, column: str) -> Optional[str]:
+        """Return the declared type of a table column, if it exists."""
+        self.c.execute(f"PRAGMA table_info({table})")
+        for row in self.c.fetchall():
+            if row[1] == column:
+                return row[2].upper()
+        return None
+
+    def _rebuild_table(
+        self, table: str, create_sql: str, conversions: Dict[str, str]
+    ) -> None:
+        """
+        Recreate a table from its current DDL, copying the existing rows.
+
+        SQLite cannot change a column's type in place, so the old table is
+        renamed, recreated and its rows copied over in a single transaction.
 
-            # Channel lock scheduling table
+        Args:
+            table: Name of the table to rebuild
+            create_sql: CREATE TABLE statement for the new layout
+            conversions: SQL expressions used to fill given columns from
+                the old row instead of copying them as-is
+        """
+        old_table = f"{table}_old"
+        self.conn.execute("BEGIN")
+        try:
+            self.c.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+            self.c.execute(f"PRAGMA table_info({old_table})")
+            old_columns = [row[1] for row in self.c.fetchall()]
+            self.c.execute(create_sql)
+            self.c.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in self.c.fetchall() if row[1] in old_columns]
             self.c.execute(
-                """
-            CREATE TABLE IF NOT EXISTS channel_lock (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                channel_id INTEGER NOT NULL,
-                creation_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                lock_in INTEGER NOT NULL,
-                channel_role INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE (guild_id, channel_id)
-            )
-            """
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(conversions.get(c, c) for c in columns)} "
+                f"FROM {old_table}"
             )
-
+            self.c.execute(f"DROP TABLE {old_table}")
             self.conn.commit()
-            logger.info("Database tables created/verified successfully")
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        logger.info("Migrated table %s to the current schema", table)
+
+    def create_table(self) -> None:
+        """Create necessary database tables if they don't exist."""
+        try:
+            with self._write_lock:
+                # Channel creation configurations table
+                self.c.execute(_SQL_CREATE_CREATION_TABLE)
+                time_type = self._column_type("channel_creation", "daily_creation_time")
+                if time_type != "INTEGER":
+                    # Older databases stored the time as "HH:MM" text
+                    self._rebuild_table(
+                        "channel_creation",
+                        _SQL_CREATE_CREATION_TABLE,
+                        {"daily_creation_time": _SQL_HHMM_TO_MINUTES},
+                    )
+
+                # Channel lock scheduling table
+                self.c.execute(_SQL_CREATE_LOCK_TABLE)
+                lock_time_type = self._column_type("channel_lock", "creation_time")
+                if lock_time_type != "INTEGER":
+                    # Older databases stored naive local "YYYY-MM-DD HH:MM:SS"
+                    # text; strftime('%s') reads it as UTC, so shift it back
+                    utc_offset = int(datetime.now(TZINFO).utcoffset().total_seconds())
+                    self._rebuild_table(
+                        "channel_lock",
+                        _SQL_CREATE_LOCK_TABLE,
+                        {
+                            "creation_time": (
+                                "CAST(strftime('%s', creation_time) AS INTEGER) "
+                                f"- {utc_offset}"
+                            )
+                        },
+                    )
+
+                # Lookups filter by guild (and often id); channel_lock is
+                # already covered by its UNIQUE (guild_id, channel_id) index
+                self.c.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_cc_guild_id "
+                    "ON channel_creation (guild_id, id)"
+                )
+                # Lets the scheduled task range-scan every guild's configs by time
+                self.c.execute("DROP INDEX IF EXISTS idx_cc_guild_time")
+                self.c.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_cc_time "
+                    "ON channel_creation (daily_creation_time)"
+                )
+                # Indexes the lock deadline itself, which is what the
+                # scheduled task's due-lock query compares against
+                self.c.execute("DROP INDEX IF EXISTS idx_cl_creation_time")
+                self.c.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_cl_lock_at "
+                    "ON channel_lock (creation_time + lock_in * 60)"
+                )
+
+                self.conn.commit()
+                logger.info("Database tables created/verified successfully")
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to create database tables: {e}")
+            logger.error("Failed to create database tables: %s", e)
             raise e
 
     def add_channel_creation(
@@ -107,40 +421,40 @@ class Database:
         Args:
             guild_id: Discord guild ID
             category_id: Discord category ID where channels will be created
-            daily_creation_time: Time to create channel (HH:MM format)
+            daily_creation_time: Time to create channel (HH:MM format), stored
+                as minutes past midnight
             close_after: Minutes after which to delete the channel
             channel_name: Name for the created channel
             channel_start_text: Initial message to post in the channel
             channel_role: Role ID that gets access to the channel
             lock_after: Minutes after which to lock the channel
         """
+        hours, _, minutes = daily_creation_time.partition(":")
+        creation_minute = int(hours) * 60 + int(minutes)
+
         try:
-            self.c.execute(
-                """
-            INSERT INTO channel_creation 
-            (guild_id, category_id, daily_creation_time, close_after, 
-             channel_name, channel_start_text, channel_role, lock_after)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    guild_id,
-                    category_id,
-                    daily_creation_time,
-                    close_after,
-                    channel_name,
-                    channel_start_text,
-                    channel_role,
-                    lock_after,
-                ),
-            )
-            self.conn.commit()
-            logger.info(f"Added channel creation config for guild {guild_id}")
+            with self._write_lock:
+                self.c.execute(
+                    _SQL_INSERT_CREATION,
+                    (
+                        guild_id,
+                        category_id,
+                        creation_minute,
+                        close_after,
+                        channel_name,
+                        channel_start_text,
+                        channel_role,
+                        lock_after,
+                    ),
+                )
+                self.conn.commit()
+                logger.info("Added channel creation config for guild %s", guild_id)
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to add channel creation config: {e}")
+            logger.error("Failed to add channel creation config: %s", e)
             raise e
 
-    def get_channel_creation(self, guild_id: int, id: int) -> Optional[Tuple[Any, ...]]:
+    def get_channel_creation(self, guild_id: int, id: int) -> Optional[ChannelCreation]:
         """
         Retrieve a specific channel creation configuration.
 
@@ -149,22 +463,23 @@ class Database:
             id: Configuration ID
 
         Returns:
-            Channel creation configuration tuple or None
+            Channel creation configuration or None
         """
         try:
-            self.c.execute(
-                "SELECT * FROM channel_creation WHERE guild_id = ? AND id = ?",
-                (guild_id, id),
+            with self._borrow_reader() as cur:
+                cur.execute(_SQL_GET_CREATION, (guild_id, id))
+                row = cur.fetchone()
+            result = ChannelCreation._make(row) if row is not None else None
+            logger.debug(
+                "Retrieved channel creation config %s for guild %s", id, guild_id
             )
-            result = self.c.fetchone()
-            logger.debug(f"Retrieved channel creation config {id} for guild {guild_id}")
             return result
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to get channel creation config: {e}")
+            logger.error("Failed to get channel creation config: %s", e)
             return None
 
-    def get_all_channel_creations(self, guild_id: int) -> List[Tuple[Any, ...]]:
+    def get_all_channel_creations(self, guild_id: int) -> List[ChannelCreation]:
         """
         Get all channel creation configurations for a guild.
 
@@ -172,22 +487,72 @@ class Database:
             guild_id: Discord guild ID
 
         Returns:
-            List of channel creation configuration tuples
+            List of channel creation configurations
         """
         try:
-            self.c.execute(
-                "SELECT * FROM channel_creation WHERE guild_id = ?", (guild_id,)
-            )
-            results = self.c.fetchall()
+            with self._borrow_reader() as cur:
+                cur.execute(_SQL_GET_CREATIONS, (guild_id,))
+                results = list(map(ChannelCreation._make, cur.fetchall()))
             logger.debug(
-                f"Retrieved {len(results)} channel creation configs for guild {guild_id}"
+                "Retrieved %d channel creation configs for guild %s",
+                len(results),
+                guild_id,
             )
             return results
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to get all channel creation configs: {e}")
+            logger.error("Failed to get all channel creation configs: %s", e)
             return []
 
+    def get_due_operations(
+        self, start_minute: Optional[int], end_minute: Optional[int], now: datetime
+    ) -> Tuple[
+        Dict[int, List[ChannelCreation]], Dict[int, List[Tuple[int, Optional[int]]]]
+    ]:
+        """
+        Get everything a scheduler tick has to act on, across all guilds.
+
+        Due creation configs and due locks come back from a single UNION ALL
+        query and are split and grouped by guild here.
+
+        Args:
+            start_minute: First minute past midnight of the window (inclusive)
+            end_minute: Last minute past midnight of the window (inclusive);
+                a value below start_minute means the window wraps midnight.
+                Both are None when no creations are due, only locks.
+            now: Current datetime in the configured timezone
+
+        Returns:
+            Tuple of (guild_id -> due creation configs, guild_id ->
+            (channel_id, channel_role) pairs due to be locked)
+        """
+        if start_minute is None:
+            sql, params = _SQL_DUE_LOCK_OPS, (now,)
+        elif start_minute <= end_minute:
+            sql, params = _SQL_GET_DUE_OPS, (start_minute, end_minute, now)
+        else:
+            sql, params = _SQL_GET_DUE_OPS_WRAPPED, (start_minute, end_minute, now)
+        creations: Dict[int, List[ChannelCreation]] = defaultdict(list)
+        locks: Dict[int, List[Tuple[int, Optional[int]]]] = defaultdict(list)
+        try:
+            with self._borrow_reader() as cur:
+                cur.execute(sql, params)
+                while rows := cur.fetchmany(FETCH_CHUNK_SIZE):
+                    for kind, *row in rows:
+                        if kind == "create":
+                            creations[row[1]].append(ChannelCreation._make(row))
+                        else:
+                            locks[row[1]].append((row[0], row[7]))
+            logger.debug(
+                "Retrieved due operations for %d guilds",
+                len(creations.keys() | locks.keys()),
+            )
+
+        except sqlite3.Error as e:
+            logger.error("Failed to get due operations: %s", e)
+
+        return creations, locks
+
     def delete_channel_creation(self, id: int, guild_id: int) -> bool:
         """
         Delete a channel creation configuration.
@@ -200,28 +565,28 @@ class Database:
             True if deletion was successful, False otherwise
         """
         try:
-            self.c.execute(
-                "DELETE FROM channel_creation WHERE id = ? AND guild_id = ?",
-                (id, guild_id),
-            )
-            self.conn.commit()
-
-            if self.c.rowcount > 0:
-                logger.info(
-                    f"Deleted channel creation config {id} for guild {guild_id}"
-                )
-                return True
-            else:
-                logger.warning(
-                    f"No channel creation config found with id {id} for guild {guild_id}"
-                )
-                return False
+            with self._write_lock:
+                self.c.execute(_SQL_DELETE_CREATION, (id, guild_id))
+                self.conn.commit()
+
+                if self.c.rowcount > 0:
+                    logger.info(
+                        "Deleted channel creation config %s for guild %s", id, guild_id
+                    )
+                    return True
+                else:
+                    logger.warning(
+                        "No channel creation config found with id %s for guild %s",
+                        id,
+                        guild_id,
+                    )
+                    return False
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to delete channel creation config: {e}")
+            logger.error("Failed to delete channel creation config: %s", e)
             return False
 
-    def get_channel_lock_by_guild(self, guild_id: int) -> List[Tuple[Any, ...]]:
+    def get_channel_lock_by_guild(self, guild_id: int) -> List[ChannelLock]:
         """
         Get all channel locks for a guild.
 
@@ -229,16 +594,19 @@ class Database:
             guild_id: Discord guild ID
 
         Returns:
-            List of channel lock configuration tuples
+            List of channel lock configurations
         """
         try:
-            self.c.execute("SELECT * FROM channel_lock WHERE guild_id = ?", (guild_id,))
-            results = self.c.fetchall()
-            logger.debug(f"Retrieved {len(results)} channel locks for guild {guild_id}")
+            with self._borrow_reader() as cur:
+                cur.execute(_SQL_GET_LOCKS, (guild_id,))
+                results = list(map(ChannelLock._make, cur.fetchall()))
+            logger.debug(
+                "Retrieved %d channel locks for guild %s", len(results), guild_id
+            )
             return results
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to get channel locks: {e}")
+            logger.error("Failed to get channel locks: %s", e)
             return []
 
     def update_channel_lock(self, guild_id: int, channel_id: int, lock_in: int) -> bool:
@@ -254,31 +622,36 @@ class Database:
             True if update was successful, False otherwise
         """
         try:
-            self.c.execute(
-                """
-            UPDATE channel_lock SET lock_in = ? WHERE guild_id = ? AND channel_id = ?
-            """,
-                (lock_in, guild_id, channel_id),
-            )
-            self.conn.commit()
-
-            if self.c.rowcount > 0:
-                logger.info(
-                    f"Updated channel lock for channel {channel_id} in guild {guild_id}"
-                )
-                return True
-            else:
-                logger.warning(
-                    f"No channel lock found for channel {channel_id} in guild {guild_id}"
-                )
-                return False
+            with self._write_lock:
+                self.c.execute(_SQL_UPDATE_LOCK, (lock_in, guild_id, channel_id))
+                self.conn.commit()
+
+                if self.c.rowcount > 0:
+                    logger.info(
+                        "Updated channel lock for channel %s in guild %s",
+                        channel_id,
+                        guild_id,
+                    )
+                    return True
+                else:
+                    logger.warning(
+                        "No channel lock found for channel %s in guild %s",
+                        channel_id,
+                        guild_id,
+                    )
+                    return False
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to update channel lock: {e}")
+            logger.error("Failed to update channel lock: %s", e)
             return False
 
     def add_channel_lock(
-        self, guild_id: int, channel_id: int, lock_in: int, channel_role: Optional[int]
+        self,
+        guild_id: int,
+        channel_id: int,
+        lock_in: int,
+        channel_role: Optional[int],
+        creation_time: Optional[datetime] = None,
     ) -> bool:
         """
         Add a new channel lock configuration.
@@ -288,49 +661,70 @@ class Database:
             channel_id: Discord channel ID
             lock_in: Minutes to wait before locking
             channel_role: Role ID that should be locked
+            creation_time: Time the lock counts from, defaults to now
 
         Returns:
             True if addition was successful, False otherwise
         """
+        # Count from the start of the minute, so the lock falls due on the
+        # tick lock_in minutes later rather than the one after it
+        creation_time = (creation_time or datetime.now(TZINFO)).replace(
+            second=0, microsecond=0
+        )
         try:
-            tz = pytz.timezone(TIMEZONE)
-            creation_time = datetime.now(tz).strftime("%Y-%m-%d %H:%M:%S")
-
-            self.c.execute(
-                """
-            INSERT OR REPLACE INTO channel_lock 
-            (guild_id, channel_id, lock_in, channel_role, creation_time)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-                (guild_id, channel_id, lock_in, channel_role, creation_time),
-            )
+            with self._write_lock:
+                # Bound as a Unix timestamp by the registered datetime adapter
+                self.c.execute(
+                    _SQL_UPSERT_LOCK,
+                    (guild_id, channel_id, lock_in, channel_role, creation_time),
+                )
 
-            self.conn.commit()
-            logger.info(
-                f"Added/updated channel lock for channel {channel_id} in guild {guild_id}"
-            )
-            return True
+                self.conn.commit()
+                logger.info(
+                    "Added/updated channel lock for channel %s in guild %s",
+                    channel_id,
+                    guild_id,
+                )
+                return True
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to add channel lock: {e}")
+            logger.error("Failed to add channel lock: %s", e)
             return False
 
-    def get_all_channel_locks(self) -> List[Tuple[Any, ...]]:
+    def iter_channel_locks(
+        self, chunk: int = FETCH_CHUNK_SIZE
+    ) -> Iterator[ChannelLock]:
         """
-        Get all channel locks across all guilds.
+        Stream all channel locks across all guilds.
 
-        Returns:
-            List of all channel lock configuration tuples
+        Rows are fetched ``chunk`` at a time, so the caller can start on the
+        first locks without the whole table being materialised in memory.
+
+        Args:
+            chunk: Number of rows fetched from SQLite per round trip
+
+        Yields:
+            Channel lock configurations
         """
         try:
-            self.c.execute("SELECT * FROM channel_lock")
-            results = self.c.fetchall()
-            logger.debug(f"Retrieved {len(results)} total channel locks")
-            return results
+            with self._borrow_reader() as cur:
+                cur.execute(_SQL_GET_ALL_LOCKS)
+                while rows := cur.fetchmany(chunk):
+                    yield from map(ChannelLock._make, rows)
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to get all channel locks: {e}")
-            return []
+            logger.error("Failed to get all channel locks: %s", e)
+
+    def get_all_channel_locks(self) -> List[ChannelLock]:
+        """
+        Get all channel locks across all guilds.
+
+        Returns:
+            List of all channel lock configurations
+        """
+        results = list(self.iter_channel_locks())
+        logger.debug("Retrieved %d total channel locks", len(results))
+        return results
 
     def delete_channel_lock(self, guild_id: int, channel_id: int) -> bool:
         """
@@ -344,30 +738,43 @@ class Database:
             True if deletion was successful, False otherwise
         """
         try:
-            self.c.execute(
-                "DELETE FROM channel_lock WHERE guild_id = ? AND channel_id = ?",
-                (guild_id, channel_id),
-            )
-            self.conn.commit()
-
-            if self.c.rowcount > 0:
-                logger.info(
-                    f"Deleted channel lock for channel {channel_id} in guild {guild_id}"
-                )
-                return True
-            else:
-                logger.warning(
-                    f"No channel lock found for channel {channel_id} in guild {guild_id}"
-                )
-                return False
+            with self._write_lock:
+                self.c.execute(_SQL_DELETE_LOCK, (guild_id, channel_id))
+                self.conn.commit()
+
+                if self.c.rowcount > 0:
+                    logger.info(
+                        "Deleted channel lock for channel %s in guild %s",
+                        channel_id,
+                        guild_id,
+                    )
+                    return True
+                else:
+                    logger.warning(
+                        "No channel lock found for channel %s in guild %s",
+                        channel_id,
+                        guild_id,
+                    )
+                    return False
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to delete channel lock: {e}")
+            logger.error("Failed to delete channel lock: %s", e)
             return False
 
     def close(self) -> None:
-        """Close the database connection."""
+        """
+        Close the writer connection and every pooled reader.
+
+        Only meant to be called at shutdown; the connections are otherwise
+        kept open for the lifetime of the process.
+        """
         try:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+
             if self.conn:
                 self.conn.close()
                 self.conn = None
@@ -375,7 +782,7 @@ class Database:
                 logger.debug("Database connection closed")
 
         except sqlite3.Error as e:
-            logger.error(f"Error closing database connection: {e}")
+            logger.error("Error closing database connection: %s", e)
 
     def __enter__(self):
         """Context manager entry."""
@@ -10,45 +10,58 @@ License: MIT
 """
 
 import asyncio
-import inspect
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 import discord
 from discord import app_commands
 
-# Import command modules to register them
-import commands.channel_creation
-import commands.message_lock
-import tasks.time_check
 from client import client
-from configuration import BOT_TOKEN
+from configuration import BOT_TOKEN, DATABASE_FILE, TASK_INTERVAL_MINUTES, TIMEZONE
 from database import database
 from resources.permissions import MissingPermissions
-from tasks.time_check import scheduled_channel_management_task
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("bot.log"), logging.StreamHandler(sys.stdout)],
+# Configure logging. Records are queued on the event loop thread and written
+# to disk/stdout by a background listener, so log I/O never blocks the loop.
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+_file_handler = RotatingFileHandler("bot.log", maxBytes=10_000_000, backupCount=5)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+# The listener's handlers apply the real format
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 
 def initialize_database() -> None:
     """Initialize the database and create necessary tables."""
     try:
-        database.connect()
         database.create_table()
-        database.close()
+        database.fill_reader_pool()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         raise
 
 
+def register_extensions() -> None:
+    """Import the command and task modules so they register with the client."""
+    import commands.channel_creation  # noqa: F401
+    import commands.message_lock  # noqa: F401
+    import tasks.time_check  # noqa: F401
+
+
 @client.event
 async def on_ready() -> None:
     """Event handler for when the bot is ready and connected to Discord."""
@@ -66,54 +79,86 @@ async def on_ready() -> None:
         if not client.user:
             raise RuntimeError("on_ready() called before Client.user was set!")
 
-        logger.info(f"Bot logged in as {client.user} (ID: {client.user.id})")
+        logger.info("Bot logged in as %s (ID: %s)", client.user, client.user.id)
         print("=" * 80)
         print(f"✅ {client.user} is now online!")
         print(f"📊 Connected to {len(client.guilds)} guild(s)")
         print("=" * 80)
 
         # Start scheduled tasks
+        from tasks.time_check import (
+            flush_channel_data,
+            scheduled_channel_management_task,
+        )
+
         if not scheduled_channel_management_task.is_running():
             scheduled_channel_management_task.start()
             logger.info("Scheduled channel management task started")
+        if not flush_channel_data.is_running():
+            flush_channel_data.start()
 
     except Exception as e:
-        logger.error(f"Error in on_ready: {e}")
+        logger.error("Error in on_ready: %s", e)
         raise
 
 
+# Error handler embeds, built once at import
+_ERROR_COLOR = discord.Color.red()
+_COOLDOWN_COLOR = discord.Color.orange()
+
+_PERM_EMBED_TEMPLATE = {
+    "title": "❌ Permission Error",
+    "color": _ERROR_COLOR.value,
+}
+
+# Never mutated, so it is safe to send the same instance every time
+_UNEXPECTED_ERROR_EMBED = discord.Embed(
+    title="❌ Error",
+    description="An unexpected error occurred while processing the command. Please try again or contact support.",
+    color=_ERROR_COLOR,
+)
+
+
+def _build_perm_embed(missing_perms: str) -> discord.Embed:
+    """Build the permission error embed for the given missing permissions."""
+    return discord.Embed.from_dict(
+        {
+            **_PERM_EMBED_TEMPLATE,
+            "description": "You are missing the following permissions to execute this command:\n"
+            f"`{missing_perms}`",
+        }
+    )
+
+
 @client.tree.error
 async def on_app_command_error(
     interaction: discord.Interaction, error: app_commands.AppCommandError
 ) -> None:
     """Global error handler for application commands."""
     try:
-        if isinstance(error, MissingPermissions):
-            missing_perms = ", ".join(error.missing_perms)
-            embed = discord.Embed(
-                title="❌ Permission Error",
-                description=f"You are missing the following permissions to execute this command:\n`{missing_perms}`",
-                color=discord.Color.red(),
+        if isinstance(error, (MissingPermissions, app_commands.MissingPermissions)):
+            # Raised by our own decorators and by app_commands.checks respectively
+            missing_perms = ", ".join(
+                error.missing_perms
+                if isinstance(error, MissingPermissions)
+                else error.missing_permissions
             )
+            embed = _build_perm_embed(missing_perms)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             logger.warning(
-                f"Permission error for user {interaction.user}: {missing_perms}"
+                "Permission error for user %s: %s", interaction.user, missing_perms
             )
 
         elif isinstance(error, app_commands.CommandOnCooldown):
             embed = discord.Embed(
                 title="⏰ Command on Cooldown",
                 description=f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
-                color=discord.Color.orange(),
+                color=_COOLDOWN_COLOR,
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
         else:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="An unexpected error occurred while processing the command. Please try again or contact support.",
-                color=discord.Color.red(),
-            )
+            embed = _UNEXPECTED_ERROR_EMBED
 
             # Try to respond if we haven't already
             if not interaction.response.is_done():
@@ -121,23 +166,31 @@ async def on_app_command_error(
             else:
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
-            logger.error(f"Unhandled command error: {error}", exc_info=True)
+            logger.error("Unhandled command error: %s", error, exc_info=True)
 
     except Exception as e:
-        logger.error(f"Error in error handler: {e}", exc_info=True)
+        logger.error("Error in error handler: %s", e, exc_info=True)
 
 
 async def main() -> None:
     """Main function to run the bot."""
+    log_listener.start()
     try:
-        # Validate configuration
-        if not BOT_TOKEN:
-            logger.error("BOT_TOKEN not found in environment variables")
-            sys.exit(1)
+        # configuration validates BOT_TOKEN on import; log its summary here,
+        # once the handlers above are in place to emit it
+        logger.info(
+            "Configuration loaded (timezone=%s, database=%s, task interval=%dm)",
+            TIMEZONE,
+            DATABASE_FILE,
+            TASK_INTERVAL_MINUTES,
+        )
 
         # Initialize database
         initialize_database()
 
+        # Register commands and tasks
+        register_extensions()
+
         # Start the bot
         logger.info("Starting Discord bot...")
         await client.start(BOT_TOKEN)
@@ -145,13 +198,15 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Bot shutdown requested by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         # Cleanup
         if not client.is_closed():
             await client.close()
+        database.close()
         logger.info("Bot shutdown complete")
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -160,5 +215,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Bot shutdown requested")
     except Exception as e:
-        logger.error(f"Failed to start bot: {e}", exc_info=True)
+        logger.error("Failed to start bot: %s", e, exc_info=True)
         sys.exit(1)
@@ -0,0 +1,47 @@
+"""
+Direct message helpers shared by commands and scheduled tasks.
+
+This module fans a DM out to many members with a bound on how many
+requests are in flight, so large roles do not burst past Discord's
+rate limits.
+"""
+
+import asyncio
+import logging
+from typing import Sequence
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on DMs in flight at once for one fan-out
+DM_CONCURRENCY = 10
+
+
+async def send_dms(members: Sequence[discord.Member], embed: discord.Embed) -> int:
+    """
+    Send the same embed to several members concurrently.
+
+    Members that cannot be messaged (closed DMs, blocked bot) are logged and
+    skipped rather than failing the whole fan-out.
+
+    Args:
+        members: Members to message
+        embed: Embed sent to each member
+
+    Returns:
+        Number of members the DM was delivered to
+    """
+    semaphore = asyncio.Semaphore(DM_CONCURRENCY)
+
+    async def send(member: discord.Member) -> bool:
+        async with semaphore:
+            try:
+                await member.send(embed=embed)
+                return True
+            except discord.HTTPException as e:
+                logger.debug("Failed to send DM to %s: %s", member, e)
+                return False
+
+    results = await asyncio.gather(*(send(member) for member in members))
+    return sum(results)
@@ -6,7 +6,7 @@ have the required permissions before executing commands.
 """
 
 import logging
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Union
 
 import discord
 from discord import app_commands
@@ -48,6 +48,14 @@ def has_permissions(**perms: bool) -> Callable[[Any], Any]:
         async def my_command(interaction):
             pass
     """
+    # Fold the requested flags into bitmasks once, at decoration time
+    required_mask = 0
+    forbidden_mask = 0
+    for perm, required_value in perms.items():
+        if required_value:
+            required_mask |= discord.Permissions(**{perm: True}).value
+        else:
+            forbidden_mask |= discord.Permissions(**{perm: True}).value
 
     def predicate(interaction: discord.Interaction) -> bool:
         """
@@ -63,25 +71,33 @@ def has_permissions(**perms: bool) -> Callable[[Any], Any]:
             MissingPermissions: If user lacks required permissions
         """
         user = interaction.user
+        # guild_permissions is recomputed from the member's roles on every access
+        guild_permissions = user.guild_permissions
 
         # Administrators bypass all permission checks
-        if user.guild_permissions.administrator:
-            logger.debug(f"User {user} has administrator permissions")
+        if guild_permissions.administrator:
+            logger.debug("User %s has administrator permissions", user)
             return True
 
-        # Check each required permission
+        # Check all required permissions with a single mask comparison
+        user_value = guild_permissions.value
+        if (user_value & required_mask) == required_mask and not (
+            user_value & forbidden_mask
+        ):
+            logger.debug(
+                "User %s has required permissions: %s", user, list(perms.keys())
+            )
+            return True
+
+        # Slow path, only to report which permissions are missing
         missing_perms = []
         for perm, required_value in perms.items():
-            user_has_perm = getattr(user.guild_permissions, perm, False)
+            user_has_perm = getattr(guild_permissions, perm, False)
             if user_has_perm != required_value:
                 missing_perms.append(perm)
 
-        if missing_perms:
-            logger.warning(f"User {user} missing permissions: {missing_perms}")
-            raise MissingPermissions(missing_perms)
-
-        logger.debug(f"User {user} has required permissions: {list(perms.keys())}")
-        return True
+        logger.warning("User %s missing permissions: %s", user, missing_perms)
+        raise MissingPermissions(missing_perms)
 
     return app_commands.check(predicate)
 
@@ -107,26 +123,32 @@ def is_guild_owner() -> Callable[[Any], Any]:
         Raises:
             MissingPermissions: If user is not the guild owner
         """
-        if interaction.user.id == interaction.guild.owner_id:
-            logger.debug(f"User {interaction.user} is guild owner")
+        user = interaction.user
+        guild = interaction.guild
+
+        if user.id == guild.owner_id:
+            logger.debug("User %s is guild owner", user)
             return True
 
-        logger.warning(f"User {interaction.user} is not guild owner")
+        logger.warning("User %s is not guild owner", user)
         raise MissingPermissions(["guild_owner"])
 
     return app_commands.check(predicate)
 
 
-def has_any_role(*role_names: str) -> Callable[[Any], Any]:
+def has_any_role(*roles: Union[int, str]) -> Callable[[Any], Any]:
     """
     Decorator to check if user has any of the specified roles.
 
     Args:
-        *role_names: Role names to check for
+        *roles: Role IDs or role names to check for
 
     Returns:
         Decorator function that checks role membership
     """
+    # Split once at decoration time so the check is a set lookup per role
+    required_ids = frozenset(role for role in roles if isinstance(role, int))
+    required_names = frozenset(role for role in roles if isinstance(role, str))
 
     def predicate(interaction: discord.Interaction) -> bool:
         """
@@ -141,13 +163,14 @@ def has_any_role(*role_names: str) -> Callable[[Any], Any]:
         Raises:
             MissingPermissions: If user lacks all specified roles
         """
-        user_roles = [role.name for role in interaction.user.roles]
-
-        if any(role_name in user_roles for role_name in role_names):
-            logger.debug(f"User {interaction.user} has required role")
+        if any(
+            role.id in required_ids or role.name in required_names
+            for role in interaction.user.roles
+        ):
+            logger.debug("User %s has required role", interaction.user)
             return True
 
-        logger.warning(f"User {interaction.user} missing roles: {role_names}")
-        raise MissingPermissions([f"role:{role}" for role in role_names])
+        logger.warning("User %s missing roles: %s", interaction.user, roles)
+        raise MissingPermissions([f"role:{role}" for role in roles])
 
     return app_commands.check(predicate)
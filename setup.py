@@ -14,20 +14,33 @@ from pathlib import Path
 
 
 def check_python_version():
-    """Check if Python version is 3.8 or higher."""
-    if sys.version_info < (3, 8):
-        print("❌ Error: Python 3.8 or higher is required.")
+    """Check if Python version is 3.9 or higher."""
+    if sys.version_info < (3, 9):
+        print("❌ Error: Python 3.9 or higher is required.")
         print(f"Current version: {sys.version}")
         sys.exit(1)
     print(f"✅ Python version: {sys.version.split()[0]}")
 
 
 def install_dependencies():
-    """Install required Python dependencies."""
+    """
+    Install required Python dependencies.
+
+    Prebuilt wheels are preferred over newer source releases, so aiohttp and
+    its C-extension dependencies are not compiled during setup.
+    """
     print("\n📦 Installing dependencies...")
     try:
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--prefer-binary",
+                "-r",
+                "requirements.txt",
+            ]
         )
         print("✅ Dependencies installed successfully!")
     except subprocess.CalledProcessError as e:
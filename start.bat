@@ -8,7 +8,7 @@ echo ======================================================
 REM Check if Python is installed
 python --version >nul 2>&1
 if errorlevel 1 (
-    echo ❌ Python is not installed. Please install Python 3.8 or higher.
+    echo ❌ Python is not installed. Please install Python 3.9 or higher.
     echo Download from: https://www.python.org/downloads/
     pause
     exit /b 1
@@ -34,7 +34,7 @@ python -m pip install --upgrade pip
 
 REM Install dependencies
 echo 📦 Installing dependencies...
-pip install -r requirements.txt
+pip install --prefer-binary -r requirements.txt
 
 REM Create configuration file if it doesn't exist
 if not exist configuration.env (
@@ -10,16 +10,16 @@ echo "======================================================"
 
 # Check if Python is installed
 if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 is not installed. Please install Python 3.8 or higher."
+    echo "❌ Python 3 is not installed. Please install Python 3.9 or higher."
     exit 1
 fi
 
 # Check Python version
 python_version=$(python3 -c 'import sys; print(".".join(map(str, sys.version_info[:2])))')
-required_version="3.8"
+required_version="3.9"
 
-if ! python3 -c "import sys; exit(0 if sys.version_info >= (3, 8) else 1)"; then
-    echo "❌ Python 3.8 or higher is required. Current version: $python_version"
+if ! python3 -c "import sys; exit(0 if sys.version_info >= (3, 9) else 1)"; then
+    echo "❌ Python 3.9 or higher is required. Current version: $python_version"
     exit 1
 fi
 
@@ -41,7 +41,7 @@ pip install --upgrade pip
 
 # Install dependencies
 echo "📦 Installing dependencies..."
-pip install -r requirements.txt
+pip install --prefer-binary -r requirements.txt
 
 # Create configuration file if it doesn't exist
 if [ ! -f "configuration.env" ]; then
@@ -6,65 +6,193 @@ including creation, deletion, and locking based on time configurations.
 """
 
 import asyncio
+import atexit
+import heapq
 import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from datetime import datetime, time, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import discord
-import pytz
 from discord.ext import tasks
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from client import client
-from configuration import TASK_INTERVAL_MINUTES, TIMEZONE
-from database import database
+from configuration import TASK_INTERVAL_MINUTES, TIMEZONE, TZINFO
+from database import ChannelCreation, database
+from resources.messaging import send_dms
 
 logger = logging.getLogger(__name__)
 
 # File for storing temporary channel deletion data
 CHANNEL_DELETE_FILE = "channel_delete.json"
 
+MINUTES_PER_DAY = 24 * 60
+
+# Wall-clock format used for scheduled times in logs
+_TIME_FMT = "%H:%M"
+
+# Run PRAGMA optimize roughly every 15 minutes
+OPTIMIZE_EVERY_TICKS = max(1, 15 // TASK_INTERVAL_MINUTES)
+
+# Upper bound on guilds processed concurrently within one tick
+GUILD_CONCURRENCY = 16
+
+# Truncate the SQLite write-ahead log roughly every hour
+CHECKPOINT_EVERY_TICKS = max(1, 60 // TASK_INTERVAL_MINUTES)
+
 
-def load_channel_data() -> Dict[str, Any]:
+def load_channel_data() -> Dict[int, Dict[int, Any]]:
     """
     Load channel deletion data from JSON file.
 
+    JSON object keys are always strings, so guild and channel ids are
+    converted back to ints once here rather than on every lookup.
+
     Returns:
         Dictionary containing channel deletion schedule data
     """
     if os.path.exists(CHANNEL_DELETE_FILE):
         try:
-            with open(CHANNEL_DELETE_FILE, "r") as file:
-                data = json.load(file)
-                logger.debug(f"Loaded channel data from {CHANNEL_DELETE_FILE}")
-                return data
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Failed to load channel data: {e}")
+            with open(CHANNEL_DELETE_FILE, "rb") as file:
+                raw = file.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                logger.debug("Loaded channel data from %s", CHANNEL_DELETE_FILE)
+                return {
+                    int(guild_id): {
+                        int(channel_id): expiration
+                        for channel_id, expiration in channels.items()
+                    }
+                    for guild_id, channels in data.items()
+                }
+        except (json.JSONDecodeError, ValueError, IOError) as e:
+            logger.error("Failed to load channel data: %s", e)
             return {}
     return {}
 
 
-def save_channel_data(channel_data: Dict[str, Any]) -> None:
+def save_channel_data(channel_data: Dict[int, Dict[int, Any]]) -> bool:
     """
     Save channel deletion data to JSON file.
 
     Args:
         channel_data: Dictionary containing channel deletion schedule data
+
+    Returns:
+        True if the data was written, False otherwise
     """
     try:
-        with open(CHANNEL_DELETE_FILE, "w") as file:
-            json.dump(channel_data, file, indent=4)
-            logger.debug(f"Saved channel data to {CHANNEL_DELETE_FILE}")
+        if orjson:
+            raw = orjson.dumps(
+                channel_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            raw = json.dumps(channel_data, indent=4).encode()
+        # Write a sibling file and swap it in, so a crash mid-write never
+        # leaves a truncated file behind
+        tmp_file = f"{CHANNEL_DELETE_FILE}.tmp"
+        with open(tmp_file, "wb") as file:
+            file.write(raw)
+        os.replace(tmp_file, CHANNEL_DELETE_FILE)
+        logger.debug("Saved channel data to %s", CHANNEL_DELETE_FILE)
+        return True
     except IOError as e:
-        logger.error(f"Failed to save channel data: {e}")
+        logger.error("Failed to save channel data: %s", e)
+        return False
 
 
-# Global channel data storage
+# Global channel data storage; the in-memory copy is authoritative and is
+# written back to disk by flush_channel_data() once it has changed
 channel_data = load_channel_data()
+_channel_data_dirty = False
+
+
+def _build_deletion_heap(data: Dict[int, Dict[int, Any]]) -> List[Tuple[int, int, int]]:
+    """
+    Build the min-heap of pending deletions from channel_data.
+
+    Older files stored the expiration as an "HH:MM" string; those entries
+    are converted in place to the next occurrence of that time.
+
+    Args:
+        data: Channel deletion schedule data
+
+    Returns:
+        Heap of (expiration timestamp, guild id, channel id) tuples
+    """
+    now = datetime.now(TZINFO)
+    now_minute = now.hour * 60 + now.minute
+    minute_start_ts = int(now.timestamp()) - now.second
+
+    heap = []
+    for guild_id, channels in data.items():
+        for channel_id, expiration in channels.items():
+            if isinstance(expiration, str):
+                hours, _, minutes = expiration.partition(":")
+                delay = (int(hours) * 60 + int(minutes) - now_minute) % MINUTES_PER_DAY
+                expiration = minute_start_ts + delay * 60
+                channels[channel_id] = expiration
+            heap.append((expiration, guild_id, channel_id))
+    heapq.heapify(heap)
+    return heap
+
+
+# Pending deletions ordered by expiration time, so each tick only touches the
+# channels that are actually due; kept in step with channel_data
+_pending_deletions = _build_deletion_heap(channel_data)
+
+# How often pending channel data changes are written to disk
+CHANNEL_DATA_FLUSH_SECONDS = 30
+
+
+def _mark_channel_data_dirty() -> None:
+    """Flag channel_data as changed so the next flush writes it out."""
+    global _channel_data_dirty
+    _channel_data_dirty = True
+
+
+@tasks.loop(seconds=CHANNEL_DATA_FLUSH_SECONDS)
+async def flush_channel_data() -> None:
+    """Write channel_data to disk if it changed since the last flush."""
+    global _channel_data_dirty
+    if not _channel_data_dirty:
+        return
+    _channel_data_dirty = False
+
+    # Snapshot so the worker thread never sees the dicts mid-update
+    snapshot = {guild_id: dict(data) for guild_id, data in channel_data.items()}
+    if not await asyncio.to_thread(save_channel_data, snapshot):
+        # Keep the changes pending so the next flush retries the write
+        _channel_data_dirty = True
+
+
+@atexit.register
+def _flush_channel_data_at_exit() -> None:
+    """Write out any channel data changes still pending at shutdown."""
+    if _channel_data_dirty:
+        save_channel_data(channel_data)
+
 
+# Fire on fixed wall-clock minutes instead of every N minutes from whenever the
+# loop started, so ticks cannot drift across a minute boundary over time
+_TICK_TIMES = [
+    time(hour=minute // 60, minute=minute % 60, tzinfo=timezone.utc)
+    for minute in range(0, MINUTES_PER_DAY, TASK_INTERVAL_MINUTES)
+]
 
-@tasks.loop(minutes=TASK_INTERVAL_MINUTES)
+# Start of the previous tick's minute, as a Unix timestamp
+_last_tick_ts: Optional[int] = None
+
+# Latest local wall-clock minute whose channel creations were handled
+_last_local_minute: Optional[datetime] = None
+
+
+@tasks.loop(time=_TICK_TIMES)
 async def scheduled_channel_management_task() -> None:
     """
     Main scheduled task that runs periodically to manage channels.
@@ -74,56 +202,141 @@ async def scheduled_channel_management_task() -> None:
     - Channels that need to be deleted
     - Channels that need to be locked
     """
+    global _last_tick_ts, _last_local_minute
+
     try:
-        now = datetime.now(pytz.timezone(TIMEZONE))
+        now = datetime.now(TZINFO)
+        tick_ts = int(now.timestamp()) - now.second
+        if tick_ts == _last_tick_ts:
+            logger.debug(
+                "Minute %s already handled, skipping tick", now.strftime(_TIME_FMT)
+            )
+            return
 
-        time_str = now.strftime("%H:%M")
+        # The creation window picks up right after the previous one so no
+        # minute is skipped. Its length is the real time elapsed, capped by
+        # how far the local clock moved: a DST jump forward does not widen
+        # it, and after a fall back the repeated hour is not handled twice.
+        local_minute = now.replace(tzinfo=None, second=0, microsecond=0)
+        if _last_tick_ts is None:
+            elapsed = TASK_INTERVAL_MINUTES
+        else:
+            elapsed = min(
+                (tick_ts - _last_tick_ts) // 60,
+                int((local_minute - _last_local_minute).total_seconds()) // 60,
+                MINUTES_PER_DAY,
+            )
+        _last_tick_ts = tick_ts
+
+        # Minutes past midnight covered by this tick (may wrap midnight), or
+        # None while the local clock is still behind the last handled minute
+        if elapsed > 0:
+            end_minute = now.hour * 60 + now.minute
+            start_minute = (end_minute - elapsed + 1) % MINUTES_PER_DAY
+            _last_local_minute = local_minute
+        else:
+            start_minute = end_minute = None
+
+        time_str = now.strftime(_TIME_FMT)
         time_str_12h = now.strftime("%I:%M %p %Z")
         logger.info(
-            f"Running scheduled task - Current time: {time_str} {TIMEZONE} ({time_str_12h})"
+            "Running scheduled task - Current time: %s %s (%s)",
+            time_str,
+            TIMEZONE,
+            time_str_12h,
         )
 
-        for guild in client.guilds:
-            try:
-                guild_id = guild.id
-                logger.debug(f"Processing guild: {guild.name} (ID: {guild_id})")
-
-                # Connect to database for this guild's operations
-                database.connect()
+        # Due creations and locks for every guild come from one query, run in a
+        # worker thread so the event loop keeps serving Discord meanwhile.
+        # Each write commits on its own; a tick-wide transaction would hold the
+        # writer lock on this thread and deadlock the worker threads.
+        due_creations, due_locks = await asyncio.to_thread(
+            database.get_due_operations, start_minute, end_minute, now
+        )
 
-                # Get all channel creation configurations for this guild
-                channels = database.get_all_channel_creations(guild_id)
+        # Only guilds with something due have anything to do; deletions
+        # are handled across all guilds further down
+        guilds = [
+            guild
+            for guild_id in due_creations.keys() | due_locks.keys()
+            if (guild := client.get_guild(guild_id)) is not None
+        ]
+
+        semaphore = asyncio.Semaphore(GUILD_CONCURRENCY)
+
+        async def process(guild: discord.Guild) -> None:
+            async with semaphore:
+                await _process_guild(
+                    guild,
+                    due_creations.get(guild.id, []),
+                    due_locks.get(guild.id, []),
+                    now,
+                )
 
-                # Process scheduled channel operations
-                await create_channels_if_scheduled(guild, channels, now)
-                await delete_expired_channels(guild, now)
-                await check_and_lock_channels(guild, now)
+        # Guilds are independent, so their Discord round-trips can overlap
+        await asyncio.gather(
+            *(process(guild) for guild in guilds), return_exceptions=True
+        )
 
-                database.close()
+        await delete_expired_channels(now)
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing guild {guild.name} (ID: {guild_id}): {e}",
-                    exc_info=True,
-                )
-                continue
+        # Periodic database maintenance
+        if scheduled_channel_management_task.current_loop % OPTIMIZE_EVERY_TICKS == 0:
+            await asyncio.to_thread(database.optimize)
+        if scheduled_channel_management_task.current_loop % CHECKPOINT_EVERY_TICKS == 0:
+            await asyncio.to_thread(database.checkpoint)
 
         logger.info("Scheduled task completed")
         print("=" * 80)
 
     except Exception as e:
-        logger.error(f"Unexpected error in scheduled task: {e}", exc_info=True)
+        logger.error("Unexpected error in scheduled task: %s", e, exc_info=True)
+
+
+async def _process_guild(
+    guild: discord.Guild,
+    channels: List[ChannelCreation],
+    due_locks: List[Tuple[int, Optional[int]]],
+    now: datetime,
+) -> None:
+    """
+    Run every scheduled channel operation for one guild.
+
+    Errors are logged rather than raised so one guild cannot abort the tick.
+
+    Args:
+        guild: Discord guild to process
+        channels: Channel creation configurations due this tick
+        due_locks: (channel_id, channel_role) pairs due to be locked
+        now: Current datetime
+    """
+    guild_id = guild.id
+    try:
+        logger.debug("Processing guild: %s (ID: %s)", guild.name, guild_id)
+
+        # Process scheduled channel operations
+        await create_channels_if_scheduled(guild, channels, now)
+        await check_and_lock_channels(guild, due_locks)
+
+    except Exception as e:
+        logger.error(
+            "Error processing guild %s (ID: %s): %s",
+            guild.name,
+            guild_id,
+            e,
+            exc_info=True,
+        )
 
 
 async def create_channels_if_scheduled(
-    guild: discord.Guild, channels: List[tuple], now: datetime
+    guild: discord.Guild, channels: List[ChannelCreation], now: datetime
 ) -> None:
     """
-    Create channels if they are scheduled for the current time.
+    Create the channels scheduled for the current tick.
 
     Args:
         guild: Discord guild to create channels in
-        channels: List of channel configuration tuples from database
+        channels: Channel configurations due this tick, from database
         now: Current datetime
     """
     for channel_config in channels:
@@ -142,101 +355,95 @@ async def create_channels_if_scheduled(
                 created_at,
             ) = channel_config
 
-            # Check if it's time to create the channel
-            if daily_creation_time == now.strftime("%H:%M"):
-                logger.info(
-                    f"Creating scheduled channel '{channel_name}' in guild {guild.name}"
-                )
+            logger.info(
+                "Creating scheduled channel '%s' in guild %s", channel_name, guild.name
+            )
 
-                # Get the category
-                category = discord.utils.get(guild.categories, id=category_id)
-                if not category:
-                    logger.error(
-                        f"Category {category_id} not found in guild {guild.name}"
-                    )
-                    continue
+            # Get the category; get_channel is a dict lookup, unlike scanning
+            # guild.categories
+            category = guild.get_channel(category_id)
+            if not isinstance(category, discord.CategoryChannel):
+                logger.error(
+                    "Category %s not found in guild %s", category_id, guild.name
+                )
+                continue
 
-                # Set up permissions (hidden by default)
-                overwrites = {
-                    guild.default_role: discord.PermissionOverwrite(view_channel=False)
-                }
+            # Set up permissions (hidden by default)
+            overwrites = {
+                guild.default_role: discord.PermissionOverwrite(view_channel=False)
+            }
 
-                # Create the channel
-                created_channel = await category.create_text_channel(
-                    name=channel_name, topic=channel_text, overwrites=overwrites
+            # Grant the role access as part of the create request instead of
+            # a separate set_permissions call afterwards
+            role = guild.get_role(channel_role) if channel_role else None
+            if role:
+                overwrites[role] = discord.PermissionOverwrite(
+                    view_channel=True, read_messages=True
+                )
+            elif channel_role:
+                logger.warning(
+                    "Role %s not found in guild %s", channel_role, guild.name
                 )
 
-                # Send initial message
-                if channel_text:
-                    await created_channel.send(f"{channel_text}")
+            # Create the channel
+            created_channel = await category.create_text_channel(
+                name=channel_name, topic=channel_text, overwrites=overwrites
+            )
 
-                # Handle role permissions
-                if channel_role:
-                    await _handle_role_permissions(
-                        guild, created_channel, channel_role, channel_text
-                    )
+            # Send initial message
+            if channel_text:
+                await created_channel.send(f"{channel_text}")
 
+            # Send DM notifications to role members
+            if role:
                 logger.info(
-                    f"✅ Created channel '{created_channel.name}' in guild {guild.name}"
+                    "✅ Granted access to role '%s' for channel '%s'",
+                    role.name,
+                    created_channel.name,
                 )
-
-                # Schedule channel deletion if specified
-                if close_after_minutes and close_after_minutes > 0:
-                    await _schedule_channel_deletion(
-                        guild,
-                        created_channel,
-                        daily_creation_time,
-                        close_after_minutes,
-                        now,
-                    )
-
-                # Schedule channel locking if specified
-                if lock_after_minutes and lock_after_minutes > 0:
-                    database.add_channel_lock(
-                        guild.id, created_channel.id, lock_after_minutes, channel_role
-                    )
-                    logger.info(
-                        f"🔒 Scheduled lock for channel '{created_channel.name}' after {lock_after_minutes} minutes"
+                if channel_text:
+                    await _send_dm_notifications(
+                        guild, role, created_channel, channel_text
                     )
 
-        except Exception as e:
-            logger.error(f"Error creating scheduled channel: {e}", exc_info=True)
-            continue
-
-
-async def _handle_role_permissions(
-    guild: discord.Guild,
-    channel: discord.TextChannel,
-    channel_role: int,
-    channel_text: str,
-) -> None:
-    """
-    Handle role-based permissions for a channel.
-
-    Args:
-        guild: Discord guild
-        channel: Created channel
-        channel_role: Role ID to grant access
-        channel_text: Text to send in DM notifications
-    """
-    try:
-        role = guild.get_role(channel_role)
-        if not role:
-            logger.warning(f"Role {channel_role} not found in guild {guild.name}")
-            return
+            logger.info(
+                "✅ Created channel '%s' in guild %s", created_channel.name, guild.name
+            )
 
-        # Grant role access to the channel
-        await channel.set_permissions(role, view_channel=True, read_messages=True)
-        logger.info(
-            f"✅ Granted access to role '{role.name}' for channel '{channel.name}'"
-        )
+            # Schedule channel deletion if specified
+            if close_after_minutes and close_after_minutes > 0:
+                await _schedule_channel_deletion(
+                    guild, created_channel, now, close_after_minutes
+                )
 
-        # Send DM notifications to role members
-        if channel_text:
-            await _send_dm_notifications(guild, role, channel, channel_text)
+            # Schedule channel locking if specified
+            if lock_after_minutes and lock_after_minutes > 0:
+                await asyncio.to_thread(
+                    database.add_channel_lock,
+                    guild.id,
+                    created_channel.id,
+                    lock_after_minutes,
+                    channel_role,
+                    now,
+                )
+                logger.info(
+                    "🔒 Scheduled lock for channel '%s' after %s minutes",
+                    created_channel.name,
+                    lock_after_minutes,
+                )
 
-    except Exception as e:
-        logger.error(f"Error handling role permissions: {e}", exc_info=True)
+        except discord.HTTPException as e:
+            # Expected API failures (missing access, rate limits) need no traceback
+            logger.warning(
+                "Failed to create scheduled channel '%s' in guild %s: %s",
+                channel_name,
+                guild.name,
+                e,
+            )
+            continue
+        except Exception as e:
+            logger.error("Error creating scheduled channel: %s", e, exc_info=True)
+            continue
 
 
 async def _send_dm_notifications(
@@ -255,7 +462,8 @@ async def _send_dm_notifications(
         channel_text: Message text
     """
     try:
-        members_with_role = [member for member in guild.members if role in member.roles]
+        # role.members reads the role's member cache instead of scanning the guild
+        members_with_role = role.members
 
         embed_dm = discord.Embed(
             title="📢 Channel Access",
@@ -265,29 +473,23 @@ async def _send_dm_notifications(
         embed_dm.add_field(name="Channel:", value=channel.mention, inline=False)
         embed_dm.set_footer(text=f"Guild: {guild.name}")
 
-        success_count = 0
-        for member in members_with_role:
-            try:
-                await member.send(embed=embed_dm)
-                success_count += 1
-            except (discord.Forbidden, discord.HTTPException) as e:
-                logger.debug(f"Failed to send DM to {member}: {e}")
-                continue
+        success_count = await send_dms(members_with_role, embed_dm)
 
         logger.info(
-            f"📧 Sent DM notifications to {success_count}/{len(members_with_role)} members"
+            "📧 Sent DM notifications to %s/%s members",
+            success_count,
+            len(members_with_role),
         )
 
     except Exception as e:
-        logger.error(f"Error sending DM notifications: {e}", exc_info=True)
+        logger.error("Error sending DM notifications: %s", e, exc_info=True)
 
 
 async def _schedule_channel_deletion(
     guild: discord.Guild,
     channel: discord.TextChannel,
-    creation_time_str: str,
-    close_after_minutes: int,
     now: datetime,
+    close_after_minutes: int,
 ) -> None:
     """
     Schedule a channel for deletion.
@@ -295,145 +497,163 @@ async def _schedule_channel_deletion(
     Args:
         guild: Discord guild
         channel: Channel to schedule for deletion
-        creation_time_str: Time when channel was created (HH:MM format)
+        now: Current datetime, taken as the channel's creation time
         close_after_minutes: Minutes to wait before deletion
-        now: Current datetime
     """
     try:
-        creation_time = datetime.strptime(creation_time_str, "%H:%M").time()
-        creation_datetime = datetime.combine(now.date(), creation_time)
-        creation_datetime = pytz.timezone(TIMEZONE).localize(creation_datetime)
-        expiration_time = creation_datetime + timedelta(minutes=close_after_minutes)
-
-        expiration_time_str = expiration_time.strftime("%H:%M")
-
-        global channel_data
-        if str(guild.id) not in channel_data:
-            channel_data[str(guild.id)] = {}
-        channel_data[str(guild.id)][str(channel.id)] = expiration_time_str
-        save_channel_data(channel_data)
-
+        # Counted from the start of the minute so a later tick firing a little
+        # earlier within its minute still sees the deletion as due
+        minute_start_ts = int(now.timestamp()) - now.second
+        expiration = minute_start_ts + close_after_minutes * 60
+        channel_data.setdefault(guild.id, {})[channel.id] = expiration
+        heapq.heappush(_pending_deletions, (expiration, guild.id, channel.id))
+        _mark_channel_data_dirty()
+
+        expiration_time_str = datetime.fromtimestamp(expiration, TZINFO).strftime(
+            _TIME_FMT
+        )
         logger.info(
-            f"🗑️ Scheduled deletion for channel '{channel.name}' at {expiration_time_str}"
+            "🗑️ Scheduled deletion for channel '%s' at %s",
+            channel.name,
+            expiration_time_str,
         )
 
     except Exception as e:
-        logger.error(f"Error scheduling channel deletion: {e}", exc_info=True)
+        logger.error("Error scheduling channel deletion: %s", e, exc_info=True)
 
 
-async def delete_expired_channels(guild: discord.Guild, now: datetime) -> None:
+async def delete_expired_channels(now: datetime) -> None:
     """
-    Delete channels that have reached their expiration time.
+    Delete channels across all guilds that have reached their expiration time.
 
     Args:
-        guild: Discord guild to check for expired channels
         now: Current datetime
     """
-    global channel_data
+    now_ts = now.timestamp()
+    failed = []
 
-    try:
-        now_time_only = now.strftime("%H:%M")
-        guild_id_str = str(guild.id)
-
-        if guild_id_str in channel_data:
-            # Create a copy of items to avoid modification during iteration
-            channels_to_check = list(channel_data[guild_id_str].items())
-
-            for channel_id_str, expiration_time_str in channels_to_check:
-                try:
-                    if now_time_only == expiration_time_str:
-                        channel_id = int(channel_id_str)
-                        channel = guild.get_channel(channel_id)
-
-                        if channel:
-                            await channel.delete(reason="Scheduled deletion")
-                            logger.info(
-                                f"🗑️ Deleted expired channel '{channel.name}' in guild {guild.name}"
-                            )
-                        else:
-                            logger.warning(
-                                f"Channel {channel_id} not found for deletion in guild {guild.name}"
-                            )
-
-                        # Remove channel from tracking
-                        del channel_data[guild_id_str][channel_id_str]
-                        save_channel_data(channel_data)
-
-                except Exception as e:
-                    logger.error(
-                        f"Error deleting expired channel {channel_id_str}: {e}",
-                        exc_info=True,
-                    )
-                    continue
+    while _pending_deletions and _pending_deletions[0][0] <= now_ts:
+        expiration, guild_id, channel_id = heapq.heappop(_pending_deletions)
 
-    except Exception as e:
-        logger.error(
-            f"Error processing expired channels for guild {guild.name}: {e}",
-            exc_info=True,
-        )
+        # Skip heap entries left behind by a later reschedule
+        scheduled = channel_data.get(guild_id, {})
+        if scheduled.get(channel_id) != expiration:
+            continue
+
+        try:
+            guild = client.get_guild(guild_id)
+            channel = guild.get_channel(channel_id) if guild else None
+
+            if channel:
+                await channel.delete(reason="Scheduled deletion")
+                logger.info(
+                    "🗑️ Deleted expired channel '%s' in guild %s",
+                    channel.name,
+                    guild.name,
+                )
+            else:
+                logger.warning(
+                    "Channel %s not found for deletion in guild %s",
+                    channel_id,
+                    guild_id,
+                )
+
+            # Remove channel from tracking
+            del scheduled[channel_id]
+            _mark_channel_data_dirty()
+
+        except discord.NotFound:
+            # Already deleted by someone else; just stop tracking it
+            del scheduled[channel_id]
+            _mark_channel_data_dirty()
+        except (discord.RateLimited, discord.DiscordServerError) as e:
+            logger.warning("Failed to delete expired channel %s: %s", channel_id, e)
+            failed.append((expiration, guild_id, channel_id))
+        except discord.HTTPException as e:
+            # Forbidden and other client errors will not go away on a retry
+            logger.warning("Dropping deletion of channel %s: %s", channel_id, e)
+            del scheduled[channel_id]
+            _mark_channel_data_dirty()
+        except Exception as e:
+            logger.error(
+                "Error deleting expired channel %s, dropping it: %s",
+                channel_id,
+                e,
+                exc_info=True,
+            )
+            del scheduled[channel_id]
+            _mark_channel_data_dirty()
+
+    # Transient failures stay due and are retried next tick
+    for entry in failed:
+        heapq.heappush(_pending_deletions, entry)
 
 
-async def check_and_lock_channels(guild: discord.Guild, now: datetime) -> None:
+async def check_and_lock_channels(
+    guild: discord.Guild, due_locks: List[Tuple[int, Optional[int]]]
+) -> None:
     """
-    Check for and lock channels that have reached their lock time.
+    Lock channels that have reached their lock time.
 
     Args:
-        guild: Discord guild to check for channels to lock
-        now: Current datetime
+        guild: Discord guild the locks belong to
+        due_locks: (channel_id, channel_role) pairs whose lock time has passed
     """
     try:
-        channel_locks = database.get_channel_lock_by_guild(guild.id)
-
-        for lock_config in channel_locks:
+        for channel_id, channel_role in due_locks:
             try:
-                (
-                    lock_id,
-                    guild_id,
-                    channel_id,
-                    creation_time,
-                    lock_in,
-                    channel_role,
-                    created_at,
-                ) = lock_config
-
-                # Parse creation time
-                creation_datetime = datetime.strptime(
-                    creation_time, "%Y-%m-%d %H:%M:%S"
-                )
-                lock_time = creation_datetime + timedelta(minutes=lock_in)
+                channel = guild.get_channel(channel_id)
+                if not channel:
+                    logger.warning(
+                        "Channel %s not found for locking in guild %s",
+                        channel_id,
+                        guild.name,
+                    )
+                    # Clean up the lock record
+                    await asyncio.to_thread(
+                        database.delete_channel_lock, guild.id, channel_id
+                    )
+                    continue
 
-                now_str = now.strftime("%H:%M")
-                lock_time_str = lock_time.strftime("%H:%M")
+                await _lock_channel_permissions(guild, channel, channel_role)
 
-                logger.debug(
-                    f"Checking lock: current={now_str}, lock_time={lock_time_str}"
+                # Remove the lock configuration from database
+                await asyncio.to_thread(
+                    database.delete_channel_lock, guild.id, channel_id
+                )
+                logger.info(
+                    "🔒 Locked and removed lock config for channel '%s' in guild %s",
+                    channel.name,
+                    guild.name,
                 )
 
-                if now_str == lock_time_str:
-                    channel = guild.get_channel(channel_id)
-                    if not channel:
-                        logger.warning(
-                            f"Channel {channel_id} not found for locking in guild {guild.name}"
-                        )
-                        # Clean up the lock record
-                        database.delete_channel_lock(guild.id, channel_id)
-                        continue
-
-                    await _lock_channel_permissions(guild, channel, channel_role)
-
-                    # Remove the lock configuration from database
-                    database.delete_channel_lock(guild.id, channel_id)
-                    logger.info(
-                        f"🔒 Locked and removed lock config for channel '{channel.name}' in guild {guild.name}"
-                    )
-
+            except (discord.NotFound, discord.Forbidden) as e:
+                # The channel is gone or the bot may not edit it; retrying
+                # cannot succeed, so drop the lock
+                logger.warning("Dropping lock for channel %s: %s", channel_id, e)
+                await asyncio.to_thread(
+                    database.delete_channel_lock, guild.id, channel_id
+                )
+            except (discord.RateLimited, discord.HTTPException) as e:
+                # The lock row stays due, so the next tick retries it
+                logger.warning("Failed to lock channel %s: %s", channel_id, e)
             except Exception as e:
-                logger.error(f"Error processing channel lock: {e}", exc_info=True)
-                continue
+                logger.error(
+                    "Error processing lock for channel %s, dropping it: %s",
+                    channel_id,
+                    e,
+                    exc_info=True,
+                )
+                await asyncio.to_thread(
+                    database.delete_channel_lock, guild.id, channel_id
+                )
 
     except Exception as e:
         logger.error(
-            f"Error checking channel locks for guild {guild.name}: {e}", exc_info=True
+            "Error checking channel locks for guild %s: %s",
+            guild.name,
+            e,
+            exc_info=True,
         )
 
 
@@ -447,33 +667,36 @@ async def _lock_channel_permissions(
         guild: Discord guild
         channel: Channel to lock
         channel_role: Role that should also be locked
-    """
-    try:
-        # Lock all existing overwrites
-        overwrites = channel.overwrites.copy()
 
-        for target, overwrite in overwrites.items():
-            new_overwrite = discord.PermissionOverwrite.from_pair(
-                overwrite.pair()[0], overwrite.pair()[1]
-            )
-            new_overwrite.read_messages = False
-            new_overwrite.view_channel = False
-            await channel.set_permissions(target, overwrite=new_overwrite)
+    Raises:
+        discord.HTTPException: If the channel could not be edited
+    """
+    # Build the locked overwrites in memory and apply them in one request.
+    # channel.overwrites hands out fresh objects, so they can be edited
+    # in place without touching the channel's cached state
+    new_overwrites = channel.overwrites
+    for overwrite in new_overwrites.values():
+        overwrite.read_messages = False
+        overwrite.view_channel = False
+
+    # Ensure the specific role is also locked
+    role = guild.get_role(channel_role) if channel_role else None
+    if role and role not in new_overwrites:
+        new_overwrites[role] = discord.PermissionOverwrite(
+            read_messages=False, view_channel=False
+        )
 
-        # Ensure the specific role is also locked
-        if channel_role:
-            role = guild.get_role(channel_role)
-            if role:
-                await channel.set_permissions(
-                    role, read_messages=False, view_channel=False
-                )
-                logger.info(
-                    f"🔒 Locked access for role '{role.name}' in channel '{channel.name}'"
-                )
+    await channel.edit(overwrites=new_overwrites, reason="Scheduled lock")
 
+    if role:
         logger.info(
-            f"🔒 Locked all permissions in channel '{channel.name}' in guild {guild.name}"
+            "🔒 Locked access for role '%s' in channel '%s'",
+            role.name,
+            channel.name,
         )
 
-    except Exception as e:
-        logger.error(f"Error locking channel permissions: {e}", exc_info=True)
+    logger.info(
+        "🔒 Locked all permissions in channel '%s' in guild %s",
+        channel.name,
+        guild.name,
+    )